@@ -0,0 +1,69 @@
+# catalog.py
+from pathlib import Path
+from models import Topic, Course, Subject
+from utils import load_yaml
+
+
+def parse_topics(topics_data: dict) -> list:
+    return [Topic(code=code, **fields) for code, fields in topics_data.items()]
+
+
+def parse_course(course_name: str, course_data: dict, base_dir: Path) -> Course:
+    """Build a Course, deferring a sharded course ({file: ...}) until it is selected"""
+    if "file" in course_data:
+        return Course(name=course_name, source=base_dir / course_data["file"])
+    return Course(
+        name=course_name,
+        template=course_data["template"],
+        topics=parse_topics(course_data.get("topics", {})),
+    )
+
+
+def parse_courses(courses_data: dict, base_dir: Path) -> list:
+    return [
+        parse_course(course_name, course_data, base_dir)
+        for course_name, course_data in courses_data.items()
+    ]
+
+
+def load_subjects(file_path):
+    """Load the subject catalog.
+
+    Accepts either the single-file layout, where every subject lists its
+    courses inline, or an index whose subjects and courses point at shard
+    files ({file: ...}, relative to the index). Shards are only read by
+    load_subject/load_course.
+    """
+    file_path = Path(file_path)
+    data = load_yaml(file_path)
+
+    subjects = []
+    for subject_name, subject_data in data["subjects"].items():
+        if "file" in subject_data:
+            subjects.append(
+                Subject(
+                    name=subject_name,
+                    source=file_path.parent / subject_data["file"],
+                )
+            )
+        else:
+            courses = parse_courses(subject_data["courses"], file_path.parent)
+            subjects.append(Subject(name=subject_name, courses=courses))
+    return subjects
+
+
+def load_subject(subject: Subject):
+    """Populate the courses of a sharded subject. No-op if already loaded."""
+    if subject.source is None or subject.courses:
+        return
+    data = load_yaml(subject.source)
+    subject.courses = parse_courses(data["courses"], subject.source.parent)
+
+
+def load_course(course: Course):
+    """Populate the template and topics of a sharded course. No-op if already loaded."""
+    if course.source is None or course.template:
+        return
+    data = load_yaml(course.source)
+    course.template = data["template"]
+    course.topics = parse_topics(data.get("topics", {}))
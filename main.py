@@ -3,16 +3,13 @@ import streamlit as st
 from PIL import Image
 from models import (
     Reflection,
-    Topic,
-    Course,
-    Subject,
     AssessmentReflection,
 )
-from utils import load_yaml
+from catalog import load_subjects, load_subject, load_course
 from templates import apply_template_to_course
 from pdf import create_summary_pdf
 
-SUBJECTS_FILE = "./data/subjects.yaml"
+SUBJECTS_FILE = "./data/subjects/index.yaml"
 
 
 def render_marks_status_bar(marks_percentage):
@@ -175,28 +172,6 @@ def apply_styles():
     )
 
 
-def load_subjects(file_path):
-    data = load_yaml(file_path)
-
-    subjects = []
-    for subject_name, subject_data in data["subjects"].items():
-        courses = []
-        for course_name, course_data in subject_data["courses"].items():
-            topics = [
-                Topic(code=code, **fields)
-                for code, fields in course_data["topics"].items()
-            ]
-            courses.append(
-                Course(
-                    name=course_name,
-                    template=course_data["template"],
-                    topics=topics,
-                )
-            )
-        subjects.append(Subject(name=subject_name, courses=courses))
-    return subjects
-
-
 def main():
     ar = AssessmentReflection()
     apply_styles()
@@ -211,9 +186,11 @@ def main():
     ar.subject = st.selectbox(
         "**Subject:**", subjects, format_func=lambda s: s.name
     )
+    load_subject(ar.subject)
     ar.course = st.selectbox(
         "**Course:**", ar.subject.courses, format_func=lambda c: c.name
     )
+    load_course(ar.course)
 
     if not ar.course.question_types:
         apply_template_to_course(ar.course)
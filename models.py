@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Optional
 from PIL import Image
 
 
@@ -36,15 +37,19 @@ class Topic:
 @dataclass
 class Course:
     name: str
-    template: str
+    template: str = ""
     topics: List[Topic] = field(default_factory=list)
     question_types: List[QuestionType] = field(default_factory=list)
+    # Shard file holding template and topics, read when the course is selected
+    source: Optional[Path] = None
 
 
 @dataclass
 class Subject:
     name: str
     courses: List[Course] = field(default_factory=list)
+    # Shard file holding courses, read when the subject is selected
+    source: Optional[Path] = None
 
 
 @dataclass